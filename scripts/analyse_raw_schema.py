@@ -14,167 +14,195 @@ Attributes:
     RAW_DIR (str): The directory containing the raw JSON files to analyze.
     OUTPUT_SCHEMA (str): The output JSON file summarizing the schema types.
     OUTPUT_EXAMPLES (str): The output JSON file containing example values.
+    OUTPUT_CACHE (str): Per-file results keyed by modification time, so unchanged files
+        are not re-walked on the next run.
 
 Functions:
-    type_name(value: Any) -> str:
-        Return a string representing the type of a value.
+    walk_json(obj: Any, type_info: Dict[str, set], examples: Dict[str, Any]):
+        Iteratively walk a JSON object, recording the data types and the first
+        example value seen for each field path.
 
-    merge_type_info(type_info: Dict[str, set], new_info: Dict[str, set]):
-        Merge type info sets.
-
-    update_example_values(example_map: Dict[str, Any], path: str, value: Any):
-        Store one example per field.
-
-    walk_json(obj: Any, path: str = "") -> Dict[str, set]:
-        Recursively walk JSON object and return a dict mapping field paths to
-        their corresponding data types.
+    load_cache(cache_file: str) -> Dict[str, Any]:
+        Load the per-file results cached by a previous run.
 
     analyse_raw_json(raw_dir: str):
-        Analyze JSON files in the specified directory, generate a schema summary,
-        and save example values for fields.
+        Analyze new or modified JSON files in the specified directory in parallel worker
+        processes, generate a schema summary, and save example values for fields.
 
 Note:
     - Processes `.json` files in the directory specified by `RAW_DIR`.
     - Skips hidden files or those starting with special system prefixes.
 """
-import json
+import multiprocessing
+import os
+import sys
 from pathlib import Path
-from collections import defaultdict
-from typing import Any, Dict
+from collections import defaultdict, deque
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 import json5
+import orjson
 from tqdm import tqdm
 
 RAW_DIR = "data/raw"
 OUTPUT_SCHEMA = "scripts/schema_summary.json"
 OUTPUT_EXAMPLES = "scripts/field_examples.json"
+OUTPUT_CACHE = "scripts/schema_cache.json"
+
+# Exact-type lookup used by walk_json, so bool is never reported as int
+_TYPE_NAMES = {
+    type(None): "null",
+    bool: "bool",
+    int: "int",
+    float: "float",
+    str: "str",
+    list: "list",
+    dict: "dict",
+}
+
+
+def walk_json(obj: Any, type_info: Dict[str, set], examples: Dict[str, Any]):
+    """
+    Iteratively walk JSON object, updating type_info in place:
+        { "path.to.field": { "str", "int", "null", ... } }
+    and storing one example value per field path in examples.
+    path is dot-separated for nested structures. Uses an explicit work-stack rather
+    than recursion so no intermediate dicts are allocated per node.
+    """
+    stack = deque([(obj, "")])
+
+    while stack:
+        node, path = stack.pop()
+        node_type = type(node)
+
+        # Handle dict (push in reverse so fields are recorded in document order)
+        if node_type is dict:
+            for key, value in reversed(node.items()):
+                stack.append((value, sys.intern(f"{path}.{key}" if path else key)))
+
+        # Handle list (elements share the same path)
+        elif node_type is list:
+            if not node:
+                # Empty list: mark as list[empty]
+                list_path = sys.intern(f"{path}[]")
+                type_info[list_path].add("empty_list")
+                if list_path not in examples:
+                    examples[list_path] = node
+            else:
+                for item in reversed(node):
+                    stack.append((item, path))
+
+        # Simple value
+        else:
+            type_info[path].add(_TYPE_NAMES.get(node_type) or node_type.__name__)
+            if path not in examples:
+                examples[path] = node
+
 
+def _process_file(file: Path) -> Optional[Tuple[Dict[str, FrozenSet[str]], Dict[str, Any]]]:
+    """
+    Parse and walk a single file, returning its partial type info and example values,
+    or None if the file could not be read or parsed.
+    Kept at module scope so it can be pickled by worker processes.
+    """
+    type_info = defaultdict(set)
+    example_values = {}
 
-def type_name(value: Any) -> str:
-    """Return a string representing the type of a value."""
-    if value is None:
-        return "null"
-    if isinstance(value, bool):
-        return "bool"
-    if isinstance(value, int):
-        return "int"
-    if isinstance(value, float):
-        return "float"
-    if isinstance(value, str):
-        return "str"
-    if isinstance(value, list):
-        return "list"
-    if isinstance(value, dict):
-        return "dict"
-    return type(value).__name__
+    try:
+        raw = file.read_bytes()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Fall back to slower, permissive loader for non-standard JSON
+            data = json5.loads(raw.decode("utf-8"))
 
+        # files might contain a list of advocates
+        if isinstance(data, list):
+            for entry in data:
+                walk_json(entry, type_info, example_values)
 
-def merge_type_info(type_info: Dict[str, set], new_info: Dict[str, set]):
-    """Merge type info sets."""
-    for key, types in new_info.items():
-        type_info[key].update(types)
-    return type_info
+        elif isinstance(data, dict):
+            walk_json(data, type_info, example_values)
 
+    except Exception as e:
+        print(f"Error reading {file}: {e}")
+        return None
 
-def update_example_values(example_map: Dict[str, Any], path: str, value: Any):
-    """Store one example per field."""
-    if path not in example_map:
-        example_map[path] = value
+    return {k: frozenset(v) for k, v in type_info.items()}, example_values
 
 
-def walk_json(obj: Any, path: str = "") -> Dict[str, set]:
+def load_cache(cache_file: str) -> Dict[str, Any]:
     """
-    Recursively walk JSON object and return a dict:
-        { "path.to.field": { "str", "int", "null", ... } }
-    path is dot-separated for nested structures.
+    Load the per-file results cached by a previous run:
+        { "path/to/file.json": { "mtime_ns": int, "types": {...}, "examples": {...} } }
+    Returns an empty cache if the file is missing or unreadable.
     """
-    type_map = defaultdict(set)
-
-    # Base case: not dict or list — simple value
-    if not isinstance(obj, (dict, list)):
-        type_map[path].add(type_name(obj))
-        return type_map
-
-    # Handle dict
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            field_path = f"{path}.{key}" if path else key
-            sub_map = walk_json(value, field_path)
-            merge_type_info(type_map, sub_map)
-        return type_map
-
-    # Handle list (walk each element)
-    if isinstance(obj, list):
-        list_path = f"{path}[]" if path else "[]"
-        if not obj:
-            # Empty list: mark as list[empty]
-            type_map[list_path].add("empty_list")
-        else:
-            for item in obj:
-                sub_map = walk_json(item, path)  # same path for elements
-                merge_type_info(type_map, sub_map)
-        return type_map
+    try:
+        return orjson.loads(Path(cache_file).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
 
 
 def analyse_raw_json(raw_dir: str):
     all_type_info = defaultdict(set)
     example_values = {}
 
-    raw_path = Path(raw_dir)
-    files = [f for f in raw_path.iterdir() if f.suffix == ".json" and not f.name.startswith("._")]
-
-    print(f"Scanning {len(files)} JSON files...")
-
-    for file in tqdm(files):
-        try:
-            with open(file, "r", encoding="utf-8") as fh:
-                data = json5.load(fh)
-
-            # files might contain a list of advocates
-            if isinstance(data, list):
-                for entry in data:
-                    type_map = walk_json(entry)
-                    merge_type_info(all_type_info, type_map)
-
-                    # Save example values
-                    for field_path, types in type_map.items():
-                        # safe retrieval — navigate through keys
-                        try:
-                            parts = field_path.replace("[]", "").split(".")
-                            val = entry
-                            for p in parts:
-                                val = val.get(p) if isinstance(val, dict) else None
-                            update_example_values(example_values, field_path, val)
-                        except Exception:
-                            pass
-
-            elif isinstance(data, dict):
-                type_map = walk_json(data)
-                merge_type_info(all_type_info, type_map)
-                for field_path in type_map:
-                    try:
-                        parts = field_path.replace("[]", "").split(".")
-                        val = data
-                        for p in parts:
-                            val = val.get(p) if isinstance(val, dict) else None
-                        update_example_values(example_values, field_path, val)
-                    except Exception:
-                        pass
-
-        except Exception as e:
-            print(f"Error reading {file}: {e}")
-
-    # Output schema file
-    with open(OUTPUT_SCHEMA, "w") as fh:
-        json.dump({k: sorted(list(v)) for k, v in all_type_info.items()}, fh, indent=2)
+    # Filter on the directory entry name before touching the file itself
+    with os.scandir(raw_dir) as it:
+        entries = [entry for entry in it
+                   if entry.name.endswith(".json") and not entry.name.startswith("._") and entry.is_file()]
+
+    # Only re-walk files that are new or modified since the cached run
+    cache = load_cache(OUTPUT_CACHE)
+    new_cache = {}
+    stale_keys = []
+    for entry in entries:
+        key = entry.path
+        mtime_ns = entry.stat().st_mtime_ns
+        cached = cache.get(key)
+        if cached and cached["mtime_ns"] == mtime_ns:
+            new_cache[key] = cached
+        else:
+            new_cache[key] = {"mtime_ns": mtime_ns}
+            stale_keys.append(key)
+
+    print(f"Scanning {len(stale_keys)} of {len(entries)} JSON files (others unchanged)...")
+
+    # Parse and walk files in parallel. Results are matched back by the original key,
+    # as Path() normalises prefixes such as './' and would no longer match the cache.
+    with multiprocessing.Pool() as pool:
+        results = pool.imap(_process_file, [Path(key) for key in stale_keys], chunksize=16)
+        for key, result in tqdm(zip(stale_keys, results), total=len(stale_keys)):
+            if result is None:
+                # Leave failed files out of the cache so the next run retries them
+                del new_cache[key]
+                continue
+            partial_types, partial_examples = result
+            entry = new_cache[key]
+            entry["types"] = {k: sorted(v) for k, v in partial_types.items()}
+            entry["examples"] = partial_examples
+
+    # Reduce the partial results of every file, cached or freshly walked
+    for entry in new_cache.values():
+        for field_path, types in entry["types"].items():
+            all_type_info[field_path].update(types)
+        for field_path, value in entry["examples"].items():
+            example_values.setdefault(field_path, value)
+
+    Path(OUTPUT_CACHE).write_bytes(orjson.dumps(new_cache))
+
+    # Output schema file (orjson has no set support, so types are written as sorted lists)
+    Path(OUTPUT_SCHEMA).write_bytes(
+        orjson.dumps({k: sorted(v) for k, v in all_type_info.items()}, option=orjson.OPT_INDENT_2)
+    )
 
     # Output example values file
-    with open(OUTPUT_EXAMPLES, "w") as fh:
-        json.dump(example_values, fh, indent=2)
+    Path(OUTPUT_EXAMPLES).write_bytes(orjson.dumps(example_values, option=orjson.OPT_INDENT_2))
 
     print(f"\nDone. Wrote:")
     print(f" - {OUTPUT_SCHEMA}")
     print(f" - {OUTPUT_EXAMPLES}")
+    print(f" - {OUTPUT_CACHE}")
 
 
 if __name__ == "__main__":
@@ -2,15 +2,40 @@
  Copyright Duel 2025
 """
 import logging
+import operator
+import threading
+from typing import Callable, Optional
+
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
 
 from src.datastore.datastore import Datastore
 logger = logging.getLogger(__name__)
 
+# Read results are memoised for a short time, as the data only changes on ingest
+CACHE_MAXSIZE = 1024
+CACHE_TTL_SECONDS = 60
+
+
+def _method_key(name: str):
+    """
+    Builds a cache key function that namespaces a method's arguments by the method name,
+    so several methods can share one cache.
+    :param name: The name of the cached method.
+    :return: A key function for `cachedmethod`.
+    """
+    return lambda self, *args, **kwargs: hashkey(name, *args, **kwargs)
+
+
 class DatastoreManager:
     """
     A datastore manager that acts as an interface for a concrete datastore object
     """
 
+    # Process-wide manager returned by instance()
+    _instance: Optional["DatastoreManager"] = None
+    _instance_lock = threading.Lock()
+
     def __init__(self, datastore: Datastore):
         """
         Constructor
@@ -18,6 +43,22 @@ class DatastoreManager:
         """
         self.datastore = datastore
         self.datastore.connect()
+        self._cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS)
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls, datastore_factory: Callable[[], Datastore]) -> "DatastoreManager":
+        """
+        Returns the shared datastore manager, creating it on first use.
+        Datastore clients such as MongoClient pool their own connections, so one per process is enough.
+        :param datastore_factory: Builds the datastore the first time the manager is created.
+        :return: The shared DatastoreManager instance.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(datastore_factory())
+        return cls._instance
 
     def __enter__(self):
         """
@@ -38,11 +79,21 @@ class DatastoreManager:
 
     def add_advocates(self, advocates) -> None:
         """
-        Adds advocates to the datastore.
+        Adds advocates to the datastore and invalidates any cached read results.
         :param advocates: The data or list of advocates to be added to the datastore.
         """
         self.datastore.add_advocates(advocates)
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Invalidates all cached read results, so the next reads go to the datastore.
+        """
+        with self._cache_lock:
+            self._cache.clear()
 
+    @cachedmethod(operator.attrgetter("_cache"), key=_method_key("get_advocate"),
+                  lock=operator.attrgetter("_cache_lock"))
     def get_advocate(self, user_id: str) -> dict:
         """
         Retrieve the advocate data for the provided user ID.
@@ -54,6 +105,8 @@ class DatastoreManager:
             logging.warning(f"Advocate not found: {user_id}")
         return result
 
+    @cachedmethod(operator.attrgetter("_cache"), key=_method_key("calculate_top_advocates"),
+                  lock=operator.attrgetter("_cache_lock"))
     def calculate_top_advocates(self, metric: str, limit: int) -> list:
         """
         Calculates a list of top advocates based on a specific metric and limit.
@@ -66,6 +119,8 @@ class DatastoreManager:
             logging.warning(f"Could not calculate top advocates for metric {metric} and limit {limit}")
         return result
 
+    @cachedmethod(operator.attrgetter("_cache"), key=_method_key("calculate_brand_performance"),
+                  lock=operator.attrgetter("_cache_lock"))
     def calculate_brand_performance(self) -> list:
         """
         Calculates the performance of a brand by obtaining data from a datastore
@@ -77,6 +132,8 @@ class DatastoreManager:
             logging.warning(f"Could not calculate brand performance")
         return result
 
+    @cachedmethod(operator.attrgetter("_cache"), key=_method_key("calculate_outliers"),
+                  lock=operator.attrgetter("_cache_lock"))
     def calculate_outliers(self, metric: str, stddev: float) -> list:
         """
         Calculate and return outliers based on the given metric and standard
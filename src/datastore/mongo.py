@@ -1,13 +1,15 @@
 """
  Copyright Duel 2025
 """
+from itertools import islice
+
 from pymongo import MongoClient
-from pymongo.errors import PyMongoError
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from src.datastore.datastore import Datastore
 import logging
+import math
 import os
-import numpy as np
 
 # Load environment variables from the .env file (if present)
 from dotenv import load_dotenv
@@ -20,6 +22,13 @@ DATABASE_PORT = os.environ.get("MONGO_PORT")
 DATABASE_USERNAME = os.environ.get("MONGO_USERNAME")
 DATABASE_PASSWORD = os.environ.get("MONGO_PASSWORD")
 DATABASE_NAME = os.environ.get("MONGO_DATABASE")
+DATABASE_MAX_POOL_SIZE = int(os.environ.get("MONGO_MAX_POOL_SIZE", 100))
+DATABASE_MIN_POOL_SIZE = int(os.environ.get("MONGO_MIN_POOL_SIZE", 0))
+# Wire compression, in order of preference (zstd needs the pymongo[zstd] extra)
+DATABASE_COMPRESSORS = os.environ.get("MONGO_COMPRESSORS", "zstd,zlib")
+
+# Maximum number of advocates sent to MongoDB in a single bulk insert
+INSERT_BATCH_SIZE = 1000
 
 logger = logging.getLogger(__name__)
 
@@ -35,20 +44,41 @@ class MongoDatastore(Datastore):
         self.client = None
         self.database = None
         self.collection = None
+        self.indexes_created = False
 
     def connect(self) -> None:
         """
-        Connects to the MongoDB database and initializes the client, database, and collection.
+        Initializes the client, database, and collection. The client connects lazily on first
+        use, so this does not block on the server being reachable.
         """
         try:
-            self.client = MongoClient(f"{DATABASE_URI}{DATABASE_USERNAME}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{DATABASE_PORT}")
+            self.client = MongoClient(
+                f"{DATABASE_URI}{DATABASE_USERNAME}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{DATABASE_PORT}",
+                maxPoolSize=DATABASE_MAX_POOL_SIZE,
+                minPoolSize=DATABASE_MIN_POOL_SIZE,
+                compressors=DATABASE_COMPRESSORS,
+                connect=False,
+            )
             self.database = self.client[DATABASE_NAME]
             self.collection = self.database["advocates"]
-            # Index collection using user_id for speed
-            self.collection.create_index("user_id")
         except ConnectionError as conn_err:
             logger.error("Error connecting to MongoDB: %s", conn_err)
 
+    def _create_indexes(self) -> None:
+        """
+        Creates the collection indexes once per datastore, ahead of the first write rather than
+        on connect, so read-only clients such as the API start without a blocking round trip.
+        """
+        if self.indexes_created:
+            return
+        try:
+            # Index collection using user_id for speed
+            self.collection.create_index("user_id", background=True)
+            self.collection.create_index("advocacy_programs.brand", background=True)
+            self.indexes_created = True
+        except PyMongoError as e:
+            logger.error("Error creating MongoDB indexes: %s", e)
+
     def disconnect(self) -> None:
         """
         Disconnects the client connection to the MongoDatastore if it exists.
@@ -60,18 +90,27 @@ class MongoDatastore(Datastore):
 
     def add_advocates(self, advocates: dict) -> None:
         """
-        Adds multiple advocate records to the database. This method inserts the provided
-        dictionary of advocate records into the MongoDB collection and ensures a
-        database index on the "user_id" field for optimized querying.
+        Adds multiple advocate records to the database. Records are inserted in chunks of
+        INSERT_BATCH_SIZE as unordered bulk writes, so the server can apply them in parallel
+        and a failing document does not abort the rest of its chunk.
 
         :param advocates: Dictionary containing advocate records to be inserted
         """
-        try:
-            self.collection.insert_many(advocates)
-        except PyMongoError as e:
-            logger.error("Error connecting to MongoDB: %s", e)
-        except Exception as e:
-            logger.error("Error inserting advocates: %s", e)
+        self._create_indexes()
+        advocates = iter(advocates)
+        while chunk := list(islice(advocates, INSERT_BATCH_SIZE)):
+            try:
+                self.collection.insert_many(chunk, ordered=False, bypass_document_validation=True)
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                logger.error("Failed to insert %d of %d advocates", len(write_errors), len(chunk))
+                for write_error in write_errors:
+                    logger.debug("Advocate insert error at index %s: %s",
+                                 write_error.get("index"), write_error.get("errmsg"))
+            except PyMongoError as e:
+                logger.error("Error connecting to MongoDB: %s", e)
+            except Exception as e:
+                logger.error("Error inserting advocates: %s", e)
 
     def get_advocate(self, user_id: str) -> dict:
         """
@@ -97,6 +136,8 @@ class MongoDatastore(Datastore):
         # Calculates a simple sum of program-level attribution
         if metric == "conversions":
             pipeline = [
+                # Skip advocates without programs before unwinding
+                {"$match": {"advocacy_programs": {"$ne": []}}},
                 {"$unwind": "$advocacy_programs"},
                 {
                     "$group": {
@@ -108,23 +149,16 @@ class MongoDatastore(Datastore):
                 },
                 {"$sort": {"total_conversions": -1}},
                 {"$limit": limit},
-                {"$project": {"_id": 0, "user_id": "$_id", "total_conversions": 1}}
+                # Rename consistently with API expectations
+                {"$project": {"_id": 0, "user_id": "$_id", "value": "$total_conversions"}}
             ]
 
-            results = list(self.collection.aggregate(pipeline))
-
-            # Rename consistently with API expectations
-            return [
-                {
-                    "user_id": r["user_id"],
-                    "value": r["total_conversions"]
-                }
-                for r in results
-            ]
+            return list(self.collection.aggregate(pipeline, allowDiskUse=True))
 
         # Calculates engagement as a sum of likes, comments, shares across ALL tasks
         if metric == "engagement":
             pipeline = [
+                {"$match": {"advocacy_programs": {"$ne": []}}},
                 {"$unwind": "$advocacy_programs"},
                 {"$unwind": "$advocacy_programs.tasks_completed"},
                 {
@@ -143,18 +177,10 @@ class MongoDatastore(Datastore):
                 },
                 {"$sort": {"total_engagement": -1}},
                 {"$limit": limit},
-                {"$project": {"_id": 0, "user_id": "$_id", "total_engagement": 1}}
+                {"$project": {"_id": 0, "user_id": "$_id", "value": "$total_engagement"}}
             ]
 
-            results = list(self.collection.aggregate(pipeline))
-
-            return [
-                {
-                    "user_id": r["user_id"],
-                    "value": r["total_engagement"]
-                }
-                for r in results
-            ]
+            return list(self.collection.aggregate(pipeline, allowDiskUse=True))
 
         # Unsupported metric
         return []
@@ -164,6 +190,7 @@ class MongoDatastore(Datastore):
         Aggregates program + task metrics across all advocates grouped by brand.
         """
         pipeline = [
+            {"$match": {"advocacy_programs": {"$ne": []}}},
             {"$unwind": "$advocacy_programs"},
             {"$unwind": "$advocacy_programs.tasks_completed"},
             {
@@ -194,7 +221,8 @@ class MongoDatastore(Datastore):
             }
         ]
 
-        return list(self.collection.aggregate(pipeline))
+        # Allow large unwinds to spill to disk rather than hit the 100 MB stage limit
+        return list(self.collection.aggregate(pipeline, allowDiskUse=True))
 
 
     def calculate_outliers(self, metric, stddev):
@@ -206,45 +234,74 @@ class MongoDatastore(Datastore):
         :return: A list of dictionaries containing user IDs and their respective metric values for those identified
         as outliers.
         """
-        # Flatten metrics for all advocates
-        advocates = list(self.collection.find({}, {
-            "user_id": 1,
-            "advocacy_programs": 1
-        }))
-
-        dataset = []
-
-        for advocate in advocates:
-            programs = advocate.get("advocacy_programs", [])
-
-            # SALES metric
-            if metric == "sales":
-                total = sum(p.get("total_sales_attributed", 0) for p in programs)
-
-            # ENGAGEMENT metric
-            else:
-                total = 0
-                for p in programs:
-                    for t in p.get("tasks_completed", []):
-                        total += (
-                                t.get("likes", 0) +
-                                t.get("comments", 0) +
-                                t.get("shares", 0)
-                        )
-
-            dataset.append({"user_id": advocate.get("user_id"), "value": total})
+        # Sum the metric per advocate on the server, keeping advocates without programs/tasks as 0
+        if metric == "sales":
+            # Summing the programs array in place needs no $unwind or $group
+            value_stages = [
+                {
+                    "$project": {
+                        "_id": 0,
+                        "user_id": 1,
+                        "value": {"$sum": "$advocacy_programs.total_sales_attributed"}
+                    }
+                },
+            ]
+        else:
+            # Unwind programs only; each program's task metrics are summed as arrays
+            value_stages = [
+                {"$project": {"user_id": 1, "advocacy_programs.tasks_completed": 1}},
+                {"$unwind": {"path": "$advocacy_programs", "preserveNullAndEmptyArrays": True}},
+                {
+                    "$group": {
+                        "_id": "$_id",
+                        "user_id": {"$first": "$user_id"},
+                        "value": {
+                            "$sum": {
+                                "$add": [
+                                    {"$sum": "$advocacy_programs.tasks_completed.likes"},
+                                    {"$sum": "$advocacy_programs.tasks_completed.comments"},
+                                    {"$sum": "$advocacy_programs.tasks_completed.shares"}
+                                ]
+                            }
+                        }
+                    }
+                },
+            ]
 
-        values = np.array([d["value"] for d in dataset])
+        # Population mean over all advocates
+        mean_stats = list(self.collection.aggregate(value_stages + [
+            {"$group": {"_id": None, "mean": {"$avg": "$value"}}}
+        ], allowDiskUse=True))
 
-        if len(values) == 0:
+        if not mean_stats:
             return []
 
-        mean = values.mean()
-        sigma = values.std()
+        mean = mean_stats[0]["mean"]
+
+        # Population standard deviation from the squared deviations around that mean, which stays
+        # accurate for large values with a small spread, unlike E[x^2] - E[x]^2
+        variance_stats = list(self.collection.aggregate(value_stages + [
+            {
+                "$group": {
+                    "_id": None,
+                    "variance": {
+                        "$avg": {
+                            "$multiply": [
+                                {"$subtract": ["$value", mean]},
+                                {"$subtract": ["$value", mean]}
+                            ]
+                        }
+                    }
+                }
+            }
+        ], allowDiskUse=True))
+        sigma = math.sqrt(variance_stats[0]["variance"])
 
         upper_limit = mean + stddev * sigma
 
-        return [
-            d for d in dataset
-            if d["value"] > upper_limit
-        ]
+        # Only the outliers are returned to the client. A second pass is used rather than
+        # $facet, whose single output document is capped at 16 MB.
+        return list(self.collection.aggregate(value_stages + [
+            {"$match": {"value": {"$gt": upper_limit}}},
+            {"$project": {"_id": 0, "user_id": 1, "value": 1}}
+        ], allowDiskUse=True))
@@ -5,10 +5,10 @@
 from datetime import datetime
 import logging
 from typing import Optional, List
-import re
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from src.models.advocacy_program import AdvocacyProgram
+from src.utilities.cleaning_utils import CleaningUtils
 
 logger = logging.getLogger(__name__)
 
@@ -48,11 +48,9 @@ class Advocate(BaseModel):
             return None
 
         original = value
-        value = value.strip().lower()
 
         # Remove undesirable characters
-        # Allow letters, numbers, underscore and '@'
-        value = re.sub(r"[^a-z0-9_@]", "", value)
+        value = CleaningUtils.remove_invalid_handle_chars(value.strip().lower())
 
         if not value:
             # The entire string was junk
@@ -3,13 +3,16 @@
 """
 
 import json5
-import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable, Iterator, List, Optional, Generator
+from typing import Any, Iterable, Iterator, List, Optional, Generator, Tuple
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from src.datastore.datastore_manager import DatastoreManager
 from src.datastore.mongo import MongoDatastore
@@ -20,6 +23,18 @@ from src.utilities.cleaning_utils import CleaningUtils
 logger = logging.getLogger(__name__)
 
 BATCH_SIZE = 500
+# Background threads used to flush batches to the datastore while files are still being parsed
+FLUSH_WORKERS = 2
+# Flushes queued or running at once, so parsed batches can't pile up in memory when MongoDB is slow
+MAX_PENDING_FLUSHES = FLUSH_WORKERS * 2
+# Files handed to a worker process per task, amortising the inter-process round trip
+FILES_PER_TASK = 16
+# Tasks queued ahead per worker process while the ingest directory is still being listed
+MAX_PENDING_TASKS_PER_WORKER = 4
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+
+# Validates and dumps a whole file's records in a single call
+_ADVOCATE_LIST_ADAPTER = TypeAdapter(List[Advocate])
 
 class AdvocateIngester:
     """
@@ -34,16 +49,23 @@ class AdvocateIngester:
         :param max_workers: The maximum number of workers to use for parallel processing
         """
         self.ingest_dir = ingest_dir
-        self.advocates: List[Advocate] = []
+        # Validated advocates (as dumped dicts), only kept in dry-run mode
+        self.advocates: List[dict] = []
         self.stats = IngestStats()
         self.write_to_datastore = write_to_datastore
         self.datastore = None
         if self.write_to_datastore:
-            self.datastore = DatastoreManager(MongoDatastore())
+            self.datastore = DatastoreManager.instance(MongoDatastore)
         self.max_workers = max_workers
         # Directory sibling to the original ingest folder for malformed and cleaned records
         self.invalid_json_dir = self.ingest_dir.parent / f"{self.ingest_dir.name}_invalid_json"
         self.failed_validation_dir = self.ingest_dir.parent / f"{self.ingest_dir.name}_failed_validation"
+        # Create the sidecar directories once up front, rather than on every record written
+        for sidecar_dir in (self.invalid_json_dir, self.failed_validation_dir):
+            try:
+                sidecar_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as mkdir_exc:
+                logger.warning(f"Failed to create sidecar directory {sidecar_dir}: {mkdir_exc}")
 
     def _iter_candidate_files(self) -> Generator[Path, None, Iterator[Any] | None]:
         """
@@ -56,13 +78,18 @@ class AdvocateIngester:
             logger.warning("Ingest directory does not exist or is not a directory: %s", self.ingest_dir)
             return iter(())
 
-        for path in self.ingest_dir.glob("*.json"):
-            self.stats.files_seen += 1
-            # Skip macOS resource-fork files like '._user_123.json'
-            if path.name.startswith("._"):
-                self.stats.files_skipped += 1
-                continue
-            yield path
+        # scandir avoids building a Path for every directory entry we then discard
+        with os.scandir(self.ingest_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".json") or not entry.is_file():
+                    continue
+                self.stats.files_seen += 1
+                # Skip macOS resource-fork files like '._user_123.json'
+                if name.startswith("._"):
+                    self.stats.files_skipped += 1
+                    continue
+                yield Path(entry.path)
         return None
 
     def _load_json(self, path: Path) -> Optional[Any]:
@@ -75,88 +102,76 @@ class AdvocateIngester:
         :return: The loaded JSON payload, or None if it's not valid JSON.
         """
         try:
-            text = path.read_text(encoding="utf-8", errors="strict")
-        except UnicodeDecodeError:
-            logger.debug(f"Skipping non-text file: {path}")
-            return None
+            data = path.read_bytes()
         except OSError as exc:
             logger.warning(f"Failed reading {path}: {exc}")
             return None
 
         try:
-            with open(path) as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            # Fall back to slower, permissive loader
-            with open(path) as f:
-                try:
-                    # Json5 handles trailing commas, missing quotes, etc.
-                    return json5.load(f)
-                except Exception as exc:
-                    logger.debug(f"Error attempting to parse json for file: {path}. Error: {exc}")
-                    self._write_invalid_json_record(path, text)
-                return None
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+        # Fall back to slower, permissive loader, which needs decoded text
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            logger.debug(f"Skipping non-text file: {path}")
+            return None
+
+        try:
+            # Json5 handles trailing commas, missing quotes, etc.
+            return json5.loads(text)
+        except Exception as exc:
+            logger.debug(f"Error attempting to parse json for file: {path}. Error: {exc}")
+            self._write_invalid_json_record(path, data)
+        return None
 
     @staticmethod
     def _clean_advocate(raw: dict) -> dict:
         """
         Cleans the raw advocate data by extracting and processing relevant fields.
         This method processes fields such as email, social media handles, and dates
-        using utility functions. It also cleans and processes data from associated
-        advocacy programs.
+        using utility functions, along with the associated advocacy programs and their
+        tasks, in a single pass.
         :param raw: A dictionary containing raw advocate data.
         :return: A dictionary containing cleaned advocate data.
         """
+        # Bind the cleaners locally, this runs for every task of every record
+        clean_handle = CleaningUtils.clean_handle
+        clean_int = CleaningUtils.clean_int
+        clean_float = CleaningUtils.clean_float
+        clean_url = CleaningUtils.clean_url
 
-        cleaned = {"user_id": raw.get("user_id"), "name": raw.get("name"),
-                   "email": CleaningUtils.clean_email(raw.get("email")),
-                   "instagram_handle": CleaningUtils.clean_handle(raw.get("instagram_handle")),
-                   "tiktok_handle": CleaningUtils.clean_handle(raw.get("tiktok_handle")),
-                   "joined_at": CleaningUtils.clean_date(raw.get("joined_at"))}
-
-        programs = []
-        for p in raw.get("advocacy_programs", []):
-            programs.append(AdvocateIngester._clean_program(p))
-
-        cleaned["advocacy_programs"] = programs
-
-        return cleaned
-
-    @staticmethod
-    def _clean_program(program: dict) -> dict:
-        """
-        Cleans a program dictionary.
-        :param program: Program data dictionary that needs to be cleaned.
-        :return: A sanitized program dictionary with processed keys and values.
-        """
-        return {
-            "program_id": program.get("program_id") or None,
-            "brand": str(program.get("brand")) if program.get("brand") is not None else None,
-            "total_sales_attributed": CleaningUtils.clean_float(program.get("total_sales_attributed")),
-            "tasks_completed": [AdvocateIngester._clean_task(task) for task in program.get("tasks_completed", [])]
-        }
-
-    @staticmethod
-    def _clean_task(task: dict) -> dict:
-        """
-        Cleans and standardizes a task dictionary by extracting and processing
-        specific required keys.
-
-        :param task: A dictionary containing information about a task.
-        :return: A dictionary containing cleaned and standardized task
-            information.
-        """
         return {
-            "task_id": task.get("task_id"),
-            "platform": task.get("platform"),
-            "post_url": CleaningUtils.clean_url(task.get("post_url")),
-            "likes": CleaningUtils.clean_int(task.get("likes")),
-            "comments": CleaningUtils.clean_int(task.get("comments")),
-            "shares": CleaningUtils.clean_int(task.get("shares")),
-            "reach": CleaningUtils.clean_int(task.get("reach")),
+            "user_id": raw.get("user_id"),
+            "name": raw.get("name"),
+            "email": CleaningUtils.clean_email(raw.get("email")),
+            "instagram_handle": clean_handle(raw.get("instagram_handle")),
+            "tiktok_handle": clean_handle(raw.get("tiktok_handle")),
+            "joined_at": CleaningUtils.clean_date(raw.get("joined_at")),
+            "advocacy_programs": [
+                {
+                    "program_id": program.get("program_id") or None,
+                    "brand": str(brand) if (brand := program.get("brand")) is not None else None,
+                    "total_sales_attributed": clean_float(program.get("total_sales_attributed")),
+                    "tasks_completed": [
+                        {
+                            "task_id": task.get("task_id"),
+                            "platform": task.get("platform"),
+                            "post_url": clean_url(task.get("post_url")),
+                            "likes": clean_int(task.get("likes")),
+                            "comments": clean_int(task.get("comments")),
+                            "shares": clean_int(task.get("shares")),
+                            "reach": clean_int(task.get("reach")),
+                        }
+                        for task in program.get("tasks_completed", [])
+                    ],
+                }
+                for program in raw.get("advocacy_programs", [])
+            ],
         }
 
-
     @staticmethod
     def _validate_advocate(clean_advocate_data: dict) -> Optional[Advocate]:
         """
@@ -165,23 +180,16 @@ class AdvocateIngester:
         """
         return Advocate.model_validate(clean_advocate_data)
 
-    def _write_invalid_json_record(self, source_path: Path, invalid_json: str) -> None:
+    def _write_invalid_json_record(self, source_path: Path, invalid_json: bytes) -> None:
         """
         Writes an invalid JSON record to a specified directory for logging and debugging purposes.
         :param source_path: Path to the source file that contains the invalid JSON.
-        :param invalid_json: The invalid JSON content to be written to the file.
+        :param invalid_json: The raw invalid JSON content, written to the file as-is.
         """
-        try:
-            self.invalid_json_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as mkdir_exc:
-            logger.warning(f"Failed to create invalid json directory {self.invalid_json_dir}: {mkdir_exc}")
-            return
-
-        out_name = f"{source_path.stem}_record_invalid_json.txt"
-        out_path = self.invalid_json_dir / out_name
+        out_path = self.invalid_json_dir / (source_path.stem + "_record_invalid_json.txt")
 
         try:
-            out_path.write_text(json.dumps(invalid_json, ensure_ascii=False, indent=2), encoding="utf-8")
+            out_path.write_bytes(invalid_json)
         except OSError as write_exc:
             logger.warning(f"Failed to write invalid json record to {out_path}: {write_exc}")
 
@@ -192,14 +200,7 @@ class AdvocateIngester:
         :param cleaned: The cleaned record that failed validation
         :param exc: The ValidationError that was raised during validation
         """
-        try:
-            self.failed_validation_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as mkdir_exc:
-            logger.warning(f"Failed to create failed validation directory {self.failed_validation_dir}: {mkdir_exc}")
-            return
-
-        out_name = f"{source_path.stem}_record_invalid.json"
-        out_path = self.failed_validation_dir / out_name
+        out_path = self.failed_validation_dir / (source_path.stem + "_record_invalid.json")
 
         payload = {
             "source_file": str(source_path),
@@ -208,22 +209,24 @@ class AdvocateIngester:
         }
 
         try:
-            out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            # orjson serialises the cleaned datetimes natively, falling back to str for error contexts.
+            # Records are kept compact, as they are meant for replaying rather than reading by hand
+            out_path.write_bytes(orjson.dumps(payload, default=str, option=orjson.OPT_NAIVE_UTC))
         except OSError as write_exc:
             logger.warning(f"Failed to write invalid record to {out_path}: {write_exc}")
 
-    def _process_file(self, path: Path) -> List[Advocate]:
+    def _process_file(self, path: Path) -> Tuple[List[dict], IngestStats]:
         """
         Process a single file: load, clean and validate records.
-        :return: A list of valid Advocate instances.
+        :return: The valid advocates dumped to JSON-compatible dicts, and the stats for this file.
         """
+        stats = IngestStats()
         payload = self._load_json(path)
         if payload is None:
-            self.stats.files_skipped += 1
-            return []
+            stats.files_skipped += 1
+            return [], stats
 
-        self.stats.files_parsed += 1
-        advocates: List[Advocate] = []
+        stats.files_parsed += 1
 
         # Many platforms emit either a single object or a list of objects
         records: Iterable[Any]
@@ -232,42 +235,50 @@ class AdvocateIngester:
         else:
             records = [payload]
 
+        cleaned_records = []
         for record in records:
             cleaned = AdvocateIngester._clean_advocate(record)
             if not cleaned:
-                self.stats.records_invalid += 1
+                stats.records_invalid += 1
                 logger.warning(
-                    "Skipping non-dict or uncleanable record in %s at index %d",
+                    "Skipping non-dict or uncleanable record in %s",
                     path
                 )
                 continue
+            cleaned_records.append(cleaned)
 
-            try:
-                model = self._validate_advocate(cleaned)
-            except ValidationError as exc:
-                self.stats.records_invalid += 1
-                # Log validation errors from pydantic
-                logger.debug(
-                    "Validation errors for %s: errors=%s, payload=%r",
-                    path,
-                    exc.errors(),
-                    cleaned,
-                )
-                # Write malformed record to sidecar directory
-                searlised_dates_data = CleaningUtils.serialise_dates(cleaned)
-                self._write_failed_validation_record(path, searlised_dates_data, exc)
-                continue
-
-            advocates.append(model)
-            self.stats.records_valid += 1
-
-        return advocates
+        # Validate the whole file in one call, only falling back to per-record
+        # validation to isolate the bad records when the batch fails
+        try:
+            advocates = _ADVOCATE_LIST_ADAPTER.validate_python(cleaned_records)
+        except ValidationError:
+            advocates = []
+            for cleaned in cleaned_records:
+                try:
+                    model = self._validate_advocate(cleaned)
+                except ValidationError as exc:
+                    stats.records_invalid += 1
+                    # Log validation errors from pydantic
+                    logger.debug(
+                        "Validation errors for %s: errors=%s, payload=%r",
+                        path,
+                        exc.errors(),
+                        cleaned,
+                    )
+                    # Write malformed record to sidecar directory
+                    self._write_failed_validation_record(path, cleaned, exc)
+                    continue
+                advocates.append(model)
+
+        stats.records_valid += len(advocates)
+        # Dump in the worker so only plain dicts are pickled back to the main process
+        return _ADVOCATE_LIST_ADAPTER.dump_python(advocates, mode="json"), stats
 
     def run(self) -> IngestStats:
         """
         Executes the ingestion process for Advocate JSON files from the specified directory.
-        This includes identifying candidate JSON files, validating their content, and
-        storing validated Advocate models into the datastore, if available.
+        This includes identifying candidate JSON files, validating their content in worker
+        processes, and storing the validated advocates into the datastore, if available.
 
         :return: `IngestStats` containing processing statistics, such as
                  number of files seen, parsed, skipped, and counts of valid or invalid records.
@@ -282,34 +293,90 @@ class AdvocateIngester:
         # Reset stats
         self.stats = IngestStats()
 
-        advocate_files = list(self._iter_candidate_files())
-        if not advocate_files:
+        candidate_files = self._iter_candidate_files()
+        # Bound the queued work, so huge directories are not enumerated into memory up front
+        max_pending = self.max_workers * MAX_PENDING_TASKS_PER_WORKER
+        files_exhausted = False
+        pending = set()
+
+        batch = []  # stores dumped Advocate records
+        flush_futures = deque()
+
+        # Parsing and validation are CPU-bound, so files are processed in separate processes,
+        # while full batches are written to the datastore in the background
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(self.ingest_dir, logging.getLogger().getEffectiveLevel())) as executor, \
+                ThreadPoolExecutor(max_workers=FLUSH_WORKERS) as flush_executor:
+            while True:
+                # Keep the workers fed while the directory is still being listed
+                while not files_exhausted and len(pending) < max_pending:
+                    paths = list(islice(candidate_files, FILES_PER_TASK))
+                    if not paths:
+                        files_exhausted = True
+                        break
+                    pending.add(executor.submit(_process_files_in_worker, paths))
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    advocates, file_stats = future.result()
+                    self.stats.merge(file_stats)
+                    if self.datastore:
+                        batch.extend(advocates)
+                        # Flush when batch gets big, handing the batch over rather than copying it
+                        if len(batch) >= BATCH_SIZE:
+                            flush_futures.append(flush_executor.submit(self.datastore.add_advocates, batch))
+                            batch = []
+                            # Drop finished flushes, then wait on the oldest while too many are still queued
+                            while flush_futures and flush_futures[0].done():
+                                flush_futures.popleft().result()
+                            while len(flush_futures) > MAX_PENDING_FLUSHES:
+                                flush_futures.popleft().result()
+                    else:
+                        # Dry-run mode
+                        self.advocates.extend(advocates)
+
+            # Final flush
+            if batch and self.datastore:
+                flush_futures.append(flush_executor.submit(self.datastore.add_advocates, batch))
+
+            # Wait for all pending flushes, surfacing any errors
+            for flush_future in flush_futures:
+                flush_future.result()
+
+        if not self.stats.files_seen:
             logger.info(f"No candidate JSON files found in {self.ingest_dir}")
-            return self.stats
 
-        batch = []  # stores validated Advocate models
+        return self.stats
 
-        futures = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            for path in advocate_files:
-                futures.append(executor.submit(self._process_file, path))
+# Per-process ingester used by worker processes, created by _init_worker
+_worker_ingester: Optional[AdvocateIngester] = None
 
-            for future in as_completed(futures):
-                advocates = future.result()
-                for advocate in advocates:
-                    if self.datastore:
-                        batch.append(advocate.model_dump(mode="json"))
-                        # Flush when batch gets big
-                        if len(batch) >= BATCH_SIZE:
-                            self.datastore.add_advocates(batch)
-                            batch.clear()
-                    else:
-                        # Dry-run mode
-                        self.advocates.append(advocate)
-        # Final flush
-        if batch and self.datastore:
-            self.datastore.add_advocates(batch)
-            batch.clear()
 
-        return self.stats
\ No newline at end of file
+def _init_worker(ingest_dir: Path, log_level: int) -> None:
+    """
+    Initializes a worker process with its own dry-run ingester, so the sidecar directories are
+    resolved once per process and no datastore connection is opened.
+    :param ingest_dir: The directory being ingested.
+    :param log_level: The log level of the main process.
+    """
+    global _worker_ingester
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+    _worker_ingester = AdvocateIngester(ingest_dir=ingest_dir, write_to_datastore=False)
+
+
+def _process_files_in_worker(paths: List[Path]) -> Tuple[List[dict], IngestStats]:
+    """
+    Processes a chunk of files in a worker process.
+    :param paths: The paths to the files to process.
+    :return: The valid advocates dumped to dicts, and the combined stats for these files.
+    """
+    advocates = []
+    stats = IngestStats()
+    for path in paths:
+        file_advocates, file_stats = _worker_ingester._process_file(path)
+        advocates.extend(file_advocates)
+        stats.merge(file_stats)
+    return advocates, stats
@@ -6,7 +6,7 @@ import argparse
 import logging
 from pathlib import Path
 
-from src.pipeline.advocate_ingester import AdvocateIngester
+from src.pipeline.advocate_ingester import AdvocateIngester, LOG_FORMAT
 logger = logging.getLogger(__name__)
 
 class AdvocatePipeline:
@@ -30,7 +30,7 @@ class AdvocatePipeline:
 
         logging.basicConfig(
             level=level,
-            format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+            format=LOG_FORMAT,
         )
 
     @staticmethod
@@ -53,7 +53,7 @@ class AdvocatePipeline:
             type=int,
             required=False,
             default=8,
-            help="Maximum number of worker threads for ingestion (default: 8)",
+            help="Maximum number of worker processes for ingestion (default: 8)",
         )
         parser.add_argument(
             "--dry-run",
@@ -4,7 +4,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestStats:
     """
     Simple stats for a single run.
@@ -13,4 +13,15 @@ class IngestStats:
     files_parsed: int = 0
     files_skipped: int = 0
     records_valid: int = 0
-    records_invalid: int = 0
\ No newline at end of file
+    records_invalid: int = 0
+
+    def merge(self, other: "IngestStats") -> None:
+        """
+        Adds the counts from another run, such as a single file processed by a worker.
+        :param other: The stats to add to this instance.
+        """
+        self.files_seen += other.files_seen
+        self.files_parsed += other.files_parsed
+        self.files_skipped += other.files_skipped
+        self.records_valid += other.records_valid
+        self.records_invalid += other.records_invalid
@@ -1,6 +1,9 @@
 """
  Copyright Duel 2025
 """
+import hashlib
+import hmac
+import threading
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Depends
@@ -9,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import logging
 
 import bcrypt
+from cachetools import TTLCache
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
@@ -25,6 +29,13 @@ app = FastAPI(
 security = HTTPBasic()
 users = {"admin": b"$2a$12$IqjOj2RTumAaEYO1ibqgqOMcLDdnQZOhaP4cEaNTyBuGfvEzfsYCy"}
 
+# bcrypt is deliberately slow, so successful logins are remembered for a short while
+# as a SHA-256 digest of the password, never the password itself
+AUTH_CACHE_MAXSIZE = 1024
+AUTH_CACHE_TTL_SECONDS = 300
+_auth_cache = TTLCache(maxsize=AUTH_CACHE_MAXSIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+_auth_cache_lock = threading.Lock()
+
 logger = logging.getLogger(__name__)
 
 # Allow Swagger UI and any local frontend
@@ -35,7 +46,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-datastore = DatastoreManager(MongoDatastore())
+datastore = DatastoreManager.instance(MongoDatastore)
 
 def verify_password(credentials: HTTPBasicCredentials = Depends(security)):
     """
@@ -43,10 +54,20 @@ def verify_password(credentials: HTTPBasicCredentials = Depends(security)):
     :param credentials: The entered credentials.
     :return: The username if the credentials are valid, else None.
     """
-    correct_login = credentials.username in users and bcrypt.checkpw(credentials.password.encode("utf-8"),
-                                                                     users.get(credentials.username))
+    password = credentials.password.encode("utf-8")
+    password_digest = hashlib.sha256(password).digest()
+    with _auth_cache_lock:
+        cached_digest = _auth_cache.get(credentials.username)
+    if cached_digest is not None and hmac.compare_digest(cached_digest, password_digest):
+        return credentials.username
+
+    correct_login = credentials.username in users and bcrypt.checkpw(password, users.get(credentials.username))
     if not correct_login:
         raise HTTPException(status_code=401, detail="Incorrect username or password")
+
+    # Only successful logins are cached, so failed guesses always pay the bcrypt cost
+    with _auth_cache_lock:
+        _auth_cache[credentials.username] = password_digest
     return credentials.username
 
 @app.get("/health", dependencies=[Depends(verify_password)])
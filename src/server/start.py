@@ -1,11 +1,27 @@
 """
  Copyright Duel 2025
 """
+import os
+
 import uvicorn
+from dotenv import load_dotenv
+load_dotenv()
+
+API_HOST = os.getenv("API_HOST", "0.0.0.0")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+# DEV=1 runs a single auto-reloading worker for local development
+DEV_MODE = os.getenv("DEV", "0") == "1"
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
 
 
 def main():
     """
     Starts and configures the Uvicorn server to run the FastAPI application.
     """
-    uvicorn.run("src.server.api:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    if DEV_MODE:
+        uvicorn.run("src.server.api:app", host=API_HOST, port=API_PORT, reload=True)
+        return
+
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]), else asyncio and h11
+    uvicorn.run("src.server.api:app", host=API_HOST, port=API_PORT, workers=WEB_CONCURRENCY,
+                loop="auto", http="auto", reload=False)
@@ -2,9 +2,18 @@
  Copyright Duel 2025
 """
 import re
+import string
 import datetime
 
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+_EMAIL_RE = re.compile(r"^[^@]+@[^@]+\.[^@]+$")
+
+# Letters, numbers, underscore and '@' are kept in handles. Other ASCII characters are
+# deleted with str.translate, the regex is only needed for non-ASCII leftovers.
+_HANDLE_KEEP = frozenset(string.ascii_lowercase + string.digits + "_@")
+_HANDLE_DELETE = str.maketrans("", "", "".join(chr(c) for c in range(128) if chr(c) not in _HANDLE_KEEP))
+_HANDLE_INVALID_CHARS = re.compile(r"[^a-z0-9_@]")
 
 
 class CleaningUtils:
@@ -17,18 +26,29 @@ class CleaningUtils:
         if not value or "@" not in value:
             return None
         value = value.strip().lower()
-        if re.match(r"^[^@]+@[^@]+\.[^@]+$", value):
+        if _EMAIL_RE.match(value):
             return value
         return None
 
+    @staticmethod
+    def remove_invalid_handle_chars(value: str) -> str:
+        """
+        Removes everything but lowercase letters, numbers, underscore and '@' from a handle.
+        :param value: The lowercased handle.
+        :return: The handle with the invalid characters removed.
+        """
+        value = value.translate(_HANDLE_DELETE)
+        if not value.isascii():
+            value = _HANDLE_INVALID_CHARS.sub("", value)
+        return value
+
     @staticmethod
     def clean_handle(value):
         if not value:
             return None
 
         # Remove weird characters
-        value = value.strip().lower()
-        value = re.sub(r"[^a-z0-9_@]", "", value)
+        value = CleaningUtils.remove_invalid_handle_chars(value.strip().lower())
 
         # Normalise: ensure single '@' at start
         if not value.startswith("@"):
@@ -41,12 +61,19 @@ class CleaningUtils:
         if not value:
             return None
         try:
-            return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except Exception:
+            # fromisoformat accepts a 'Z' suffix on date-times, but not on date-only values
+            # such as '2024-01-01Z', so those are still rewritten. This only copies when needed.
+            if value.endswith("Z"):
+                value = value[:-1] + "+00:00"
+            return datetime.datetime.fromisoformat(value)
+        except (AttributeError, TypeError, ValueError):
             return None
 
     @staticmethod
     def clean_int(value):
+        # Most metrics already arrive as ints
+        if type(value) is int:
+            return value
         if value is None:
             return 0
         try:
@@ -56,6 +83,8 @@ class CleaningUtils:
 
     @staticmethod
     def clean_float(value):
+        if type(value) is float:
+            return value
         if value is None:
             return 0.0
         try:
@@ -68,7 +97,10 @@ class CleaningUtils:
         if not value or not isinstance(value, str):
             return None
         value = value.strip()
-        parsed = urlparse(value)
+        # Without '://' there can be no scheme and netloc, so skip parsing entirely
+        if "://" not in value:
+            return None
+        parsed = urlsplit(value)
         if parsed.scheme and parsed.netloc:
             return value
         return None
@@ -0,0 +1,69 @@
+"""
+ Copyright Duel 2025
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.datastore.datastore_manager import DatastoreManager
+
+
+@pytest.fixture
+def manager():
+    datastore = MagicMock()
+    datastore.get_advocate.return_value = {"user_id": "u1"}
+    datastore.calculate_top_advocates.return_value = [{"user_id": "u1", "value": 10}]
+    datastore.calculate_brand_performance.return_value = [{"brand": "BrandA"}]
+    datastore.calculate_outliers.return_value = [{"user_id": "u1", "value": 100}]
+    return DatastoreManager(datastore)
+
+
+def test_get_advocate_is_cached(manager):
+    assert manager.get_advocate("u1") == {"user_id": "u1"}
+    assert manager.get_advocate("u1") == {"user_id": "u1"}
+    manager.datastore.get_advocate.assert_called_once_with("u1")
+
+    manager.get_advocate("u2")
+    assert manager.datastore.get_advocate.call_count == 2
+
+
+def test_top_advocates_cached_per_arguments(manager):
+    manager.calculate_top_advocates("conversions", 10)
+    manager.calculate_top_advocates("conversions", 10)
+    manager.calculate_top_advocates("engagement", 10)
+
+    assert manager.datastore.calculate_top_advocates.call_count == 2
+
+
+def test_add_advocates_invalidates_cache(manager):
+    manager.get_advocate("u1")
+    manager.add_advocates([{"user_id": "u1"}])
+    manager.get_advocate("u1")
+
+    assert manager.datastore.get_advocate.call_count == 2
+
+
+def test_metrics_cached_until_cleared(manager):
+    manager.calculate_brand_performance()
+    manager.calculate_outliers("sales", 2)
+    manager.calculate_brand_performance()
+    manager.calculate_outliers("sales", 2)
+    manager.calculate_outliers("sales", 3)
+
+    assert manager.datastore.calculate_brand_performance.call_count == 1
+    assert manager.datastore.calculate_outliers.call_count == 2
+
+    manager.clear_cache()
+    manager.calculate_brand_performance()
+
+    assert manager.datastore.calculate_brand_performance.call_count == 2
+
+
+@patch.object(DatastoreManager, "_instance", None)
+def test_instance_is_shared():
+    datastore_factory = MagicMock()
+    first = DatastoreManager.instance(datastore_factory)
+
+    assert DatastoreManager.instance(datastore_factory) is first
+    datastore_factory.assert_called_once_with()
+    first.datastore.connect.assert_called_once_with()
@@ -1,3 +1,6 @@
+import copy
+import statistics
+
 import pytest
 from unittest.mock import patch
 import mongomock
@@ -5,46 +8,74 @@ import mongomock
 from src.datastore.mongo import MongoDatastore
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mocked_mongo():
-    """Patches MongoClient inside MongoDatastore to use mongomock."""
-    with patch("src.datastore.mongo.MongoClient", new=mongomock.MongoClient):
-        ds = MongoDatastore()
-        ds.connect()
-        yield ds
-        ds.disconnect()
+    """Patches MongoClient inside MongoDatastore to use mongomock, connecting once per session."""
+    patcher = patch("src.datastore.mongo.MongoClient", new=mongomock.MongoClient)
+    patcher.start()
+    ds = MongoDatastore()
+    ds.connect()
+    yield ds
+    ds.disconnect()
+    patcher.stop()
+
+
+@pytest.fixture(autouse=True)
+def _clean_mongo(mocked_mongo):
+    """Empties every collection before each test, reusing the session connection."""
+    for name in mocked_mongo.database.list_collection_names():
+        mocked_mongo.database[name].delete_many({})
+    yield
+
+
+# Two simple advocate docs for testing. insert_many adds an _id to each document it is given,
+# so tests insert copies from sample_advocates() rather than these templates.
+SAMPLE_ADVOCATES = (
+    {
+        "user_id": "u1",
+        "name": "Alice",
+        "advocacy_programs": [
+            {
+                "brand": "BrandA",
+                "total_sales_attributed": 100,
+                "tasks_completed": [
+                    {"likes": 10, "comments": 2, "shares": 1, "reach": 1000}
+                ]
+            }
+        ]
+    },
+    {
+        "user_id": "u2",
+        "name": "Bob",
+        "advocacy_programs": [
+            {
+                "brand": "BrandB",
+                "total_sales_attributed": 400,
+                "tasks_completed": [
+                    {"likes": 50, "comments": 10, "shares": 5, "reach": 3000}
+                ]
+            }
+        ]
+    },
+)
 
 
 def sample_advocates():
-    """Returns two simple advocate docs for testing."""
-    return [
-        {
-            "user_id": "u1",
-            "name": "Alice",
-            "advocacy_programs": [
-                {
-                    "brand": "BrandA",
-                    "total_sales_attributed": 100,
-                    "tasks_completed": [
-                        {"likes": 10, "comments": 2, "shares": 1, "reach": 1000}
-                    ]
-                }
-            ]
-        },
-        {
-            "user_id": "u2",
-            "name": "Bob",
-            "advocacy_programs": [
-                {
-                    "brand": "BrandB",
-                    "total_sales_attributed": 400,
-                    "tasks_completed": [
-                        {"likes": 50, "comments": 10, "shares": 5, "reach": 3000}
-                    ]
-                }
-            ]
-        },
-    ]
+    """Returns fresh copies of the sample advocate docs."""
+    return [copy.deepcopy(advocate) for advocate in SAMPLE_ADVOCATES]
+
+
+@pytest.fixture(scope="module")
+def seeded_mongo(mocked_mongo):
+    """
+    A separate datastore seeded once with the sample advocates, for tests that only read.
+    Each mongomock client has its own store, so the per-test truncation of mocked_mongo leaves it alone.
+    """
+    ds = MongoDatastore()
+    ds.connect()
+    ds.add_advocates(sample_advocates())
+    yield ds
+    ds.disconnect()
 
 def test_add_and_get_advocate(mocked_mongo):
     ds = mocked_mongo
@@ -60,9 +91,8 @@ def test_add_and_get_advocate(mocked_mongo):
 
     assert ds.get_advocate("missing") is None
 
-def test_calculate_top_advocates_conversions(mocked_mongo):
-    ds = mocked_mongo
-    ds.add_advocates(sample_advocates())
+def test_calculate_top_advocates_conversions(seeded_mongo):
+    ds = seeded_mongo
 
     results = ds.calculate_top_advocates("conversions", limit=2)
 
@@ -70,9 +100,8 @@ def test_calculate_top_advocates_conversions(mocked_mongo):
     assert results[0]["user_id"] == "u2"  # Bob has 400 sales
     assert results[1]["user_id"] == "u1"  # Alice has 100 sales
 
-def test_calculate_top_advocates_engagement(mocked_mongo):
-    ds = mocked_mongo
-    ds.add_advocates(sample_advocates())
+def test_calculate_top_advocates_engagement(seeded_mongo):
+    ds = seeded_mongo
 
     results = ds.calculate_top_advocates("engagement", limit=2)
 
@@ -81,9 +110,8 @@ def test_calculate_top_advocates_engagement(mocked_mongo):
     assert results[0]["user_id"] == "u2"
     assert results[1]["user_id"] == "u1"
 
-def test_calculate_brand_performance(mocked_mongo):
-    ds = mocked_mongo
-    ds.add_advocates(sample_advocates())
+def test_calculate_brand_performance(seeded_mongo):
+    ds = seeded_mongo
 
     results = ds.calculate_brand_performance()
 
@@ -98,9 +126,8 @@ def test_calculate_brand_performance(mocked_mongo):
     assert brands["BrandB"]["total_sales"] == 400
     assert brands["BrandB"]["total_tasks"] == 1
 
-def test_calculate_outliers_sales(mocked_mongo):
-    ds = mocked_mongo
-    ds.add_advocates(sample_advocates())
+def test_calculate_outliers_sales(seeded_mongo):
+    ds = seeded_mongo
 
     # Bob has 400, Alice has 100 → Bob is an outlier
     results = ds.calculate_outliers("sales", stddev=0.5)
@@ -109,12 +136,84 @@ def test_calculate_outliers_sales(mocked_mongo):
     assert results[0]["user_id"] == "u2"
     assert results[0]["value"] == 400
 
-def test_calculate_outliers_engagement(mocked_mongo):
-    ds = mocked_mongo
-    ds.add_advocates(sample_advocates())
+def test_calculate_outliers_engagement(seeded_mongo):
+    ds = seeded_mongo
 
     # Bob: 65, Alice: 13 → Bob is outlier
     results = ds.calculate_outliers("engagement", stddev=0.5)
 
     assert len(results) == 1
     assert results[0]["user_id"] == "u2"
+
+
+def test_calculate_outliers_large_values_small_spread(mocked_mongo):
+    ds = mocked_mongo
+    # Sales around 1e8 varying by 1, where E[x^2] - E[x]^2 loses all precision
+    sales = [1e8] * 9 + [1e8 + 1]
+    ds.add_advocates([
+        {"user_id": f"u{i}", "name": f"n{i}", "advocacy_programs": [{"total_sales_attributed": value}]}
+        for i, value in enumerate(sales)
+    ])
+
+    results = ds.calculate_outliers("sales", stddev=2)
+
+    assert results == [{"user_id": "u9", "value": 1e8 + 1}]
+
+
+# Few rounds, as mongomock aggregates in Python and a 10,000 advocate run takes close to a second.
+# The scale benchmarks are opt-in, see the README for running them
+BENCHMARK_ROUNDS = 3
+
+
+@pytest.fixture(scope="module", params=[100, 10_000], ids=lambda count: f"{count}_advocates")
+def large_mongo(request, mocked_mongo):
+    """
+    A separate datastore seeded once per size with many single-program advocates, used to check the
+    aggregations still return quickly and correctly as the collection grows.
+    """
+    ds = MongoDatastore()
+    ds.connect()
+    ds.add_advocates([
+        {
+            "user_id": f"u{i}",
+            "name": f"n{i}",
+            "advocacy_programs": [
+                {
+                    "brand": f"b{i % 10}",
+                    "total_sales_attributed": i,
+                    "tasks_completed": [{"likes": i, "comments": 0, "shares": 0, "reach": i * 10}]
+                }
+            ]
+        }
+        for i in range(request.param)
+    ])
+    yield ds, request.param
+    ds.disconnect()
+
+@pytest.mark.scale
+def test_top_advocates_scale(large_mongo, benchmark):
+    ds, count = large_mongo
+
+    results = benchmark.pedantic(ds.calculate_top_advocates, args=("conversions",), kwargs={"limit": 10},
+                                 rounds=BENCHMARK_ROUNDS)
+
+    assert [r["user_id"] for r in results] == [f"u{i}" for i in range(count - 1, count - 11, -1)]
+
+@pytest.mark.scale
+def test_brand_performance_scale(large_mongo, benchmark):
+    ds, count = large_mongo
+
+    results = benchmark.pedantic(ds.calculate_brand_performance, rounds=BENCHMARK_ROUNDS)
+
+    assert len(results) == 10
+    assert sum(r["total_tasks"] for r in results) == count
+
+@pytest.mark.scale
+def test_outliers_scale(large_mongo, benchmark):
+    ds, count = large_mongo
+    # Sales are 0..count-1, so everyone above one population standard deviation over the mean is an outlier
+    upper_limit = statistics.fmean(range(count)) + statistics.pstdev(range(count))
+
+    results = benchmark.pedantic(ds.calculate_outliers, args=("sales", 1), rounds=BENCHMARK_ROUNDS)
+
+    assert sorted(r["value"] for r in results) == [i for i in range(count) if i > upper_limit]
@@ -9,7 +9,10 @@ from src.models.advocate import Advocate
 from src.models.advocacy_program import AdvocacyProgram
 from src.models.advocacy_task import AdvocacyTask
 
-@pytest.fixture
+# The valid_* fixtures are shared templates built once per session. Tests never change them,
+# variants are built as new dicts by unpacking the template with the replaced keys.
+
+@pytest.fixture(scope="session")
 def valid_task():
     return {
         "task_id": "1234",
@@ -22,7 +25,7 @@ def valid_task():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_program(valid_task):
     return {
         "program_id": "abcd",
@@ -32,7 +35,7 @@ def valid_program(valid_task):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_user(valid_program):
     return {
         "user_id": "user-1",
@@ -58,22 +61,18 @@ def test_task_valid(valid_task):
 
 
 def test_task_invalid_url(valid_task):
-    invalid = valid_task.copy()
-    invalid["post_url"] = "not-a-url"
     with pytest.raises(ValidationError):
-        AdvocacyTask(**invalid)
+        AdvocacyTask(**{**valid_task, "post_url": "not-a-url"})
 
 
 def test_task_missing_required_field(valid_task):
-    invalid = valid_task.copy()
-    invalid.pop("task_id")
+    invalid = {key: value for key, value in valid_task.items() if key != "task_id"}
     with pytest.raises(ValidationError):
         AdvocacyTask(**invalid)
 
 
 def test_task_number_coercion(valid_task):
-    valid_task["likes"] = "250"
-    task = AdvocacyTask(**valid_task)
+    task = AdvocacyTask(**{**valid_task, "likes": "250"})
     assert task.likes == 250
 
 
@@ -88,15 +87,12 @@ def test_program_valid(valid_program):
 
 
 def test_program_invalid_sales_number(valid_program):
-    invalid = valid_program.copy()
-    invalid["total_sales_attributed"] = "bad-num"
     with pytest.raises(ValidationError):
-        AdvocacyProgram(**invalid)
+        AdvocacyProgram(**{**valid_program, "total_sales_attributed": "bad-num"})
 
 
 def test_program_tasks_nested_validation(valid_program):
-    invalid = valid_program.copy()
-    invalid["tasks_completed"] = [{
+    invalid = {**valid_program, "tasks_completed": [{
         "task_id": None,
         "platform": "TikTok",
         "post_url": "https://x.com",
@@ -104,7 +100,7 @@ def test_program_tasks_nested_validation(valid_program):
         "comments": 2,
         "shares": 1,
         "reach": 100
-    }]
+    }]}
     with pytest.raises(ValidationError):
         AdvocacyProgram(**invalid)
 
@@ -121,60 +117,41 @@ def test_advocate_valid(valid_user):
 
 
 def test_advocate_invalid_email(valid_user):
-    invalid = valid_user.copy()
-    invalid["email"] = "bad-email"
     with pytest.raises(ValidationError):
-        Advocate(**invalid)
+        Advocate(**{**valid_user, "email": "bad-email"})
 
 
 def test_advocate_missing_required(valid_user):
-    invalid = valid_user.copy()
-    invalid.pop("name")
+    invalid = {key: value for key, value in valid_user.items() if key != "name"}
     with pytest.raises(ValidationError):
         Advocate(**invalid)
 
 
-def test_advocate_nested_program_validation(valid_user):
-    invalid = valid_user.copy()
-    invalid["advocacy_programs"] = [{
-        "program_id": "xyz",
-        "brand": "Brand",
-        "total_sales_attributed": 999,
-        "tasks_completed": [{
-            # task_id missing → invalid
-            "platform": "Instagram",
-            "post_url": "https://example.com",
-            "likes": 1,
-            "comments": 1,
-            "shares": 1,
-            "reach": 1
-        }]
-    }]
+def test_advocate_nested_program_validation(valid_user, valid_program, valid_task):
+    # task_id missing → invalid
+    bad_task = {key: value for key, value in valid_task.items() if key != "task_id"}
+    bad_program = {**valid_program, "tasks_completed": [bad_task]}
 
     with pytest.raises(ValidationError):
-        Advocate(**invalid)
+        Advocate(**{**valid_user, "advocacy_programs": [bad_program]})
 
 
 def test_advocate_date_parsing(valid_user):
     user = Advocate(**valid_user)
     assert isinstance(user.joined_at, datetime)
 
-def test_handle_normalisation(valid_user):
-    valid_user["instagram_handle"] = "  Alice__99 "
-    user = Advocate(**valid_user)
-    assert user.instagram_handle == "@alice__99"
-
-def test_handle_removes_invalid_chars(valid_user):
-    valid_user["instagram_handle"] = "###Bad!!"
-    user = Advocate(**valid_user)
-    assert user.instagram_handle == "@bad"
+@pytest.mark.parametrize("value, expected", [
+    ("  Alice__99 ", "@alice__99"),
+    ("###Bad!!", "@bad"),
+    (None, None),
+    ("!!!!", None),
+])
+def test_clean_handle(value, expected):
+    # The cleaning rules are tested directly, without building a whole Advocate each time
+    assert Advocate._clean_handle(value) == expected
 
-def test_handle_none(valid_user):
-    valid_user["instagram_handle"] = None
-    user = Advocate(**valid_user)
-    assert user.instagram_handle is None
 
-def test_handle_invalid_becomes_none(valid_user):
-    valid_user["instagram_handle"] = "!!!!"
-    user = Advocate(**valid_user)
-    assert user.instagram_handle is None
+def test_handles_cleaned_on_validation(valid_user):
+    user = Advocate(**{**valid_user, "instagram_handle": "  Alice__99 ", "tiktok_handle": "!!!!"})
+    assert user.instagram_handle == "@alice__99"
+    assert user.tiktok_handle is None
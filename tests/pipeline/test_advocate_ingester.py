@@ -0,0 +1,138 @@
+"""
+ Copyright Duel 2025
+"""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.pipeline import advocate_ingester
+from src.pipeline.advocate_ingester import AdvocateIngester
+
+
+@pytest.fixture
+def ingest_dir(tmp_path):
+    path = tmp_path / "raw"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def ingester(ingest_dir):
+    return AdvocateIngester(ingest_dir=ingest_dir, write_to_datastore=False)
+
+
+def test_load_json_valid(ingester, ingest_dir):
+    path = ingest_dir / "user.json"
+    path.write_text(json.dumps({"user_id": "u1"}), encoding="utf-8")
+    assert ingester._load_json(path) == {"user_id": "u1"}
+
+
+def test_load_json_json5_fallback(ingester, ingest_dir):
+    path = ingest_dir / "user.json"
+    path.write_text("{user_id: 'u1',}", encoding="utf-8")
+    assert ingester._load_json(path) == {"user_id": "u1"}
+
+
+def test_load_json_invalid_writes_sidecar(ingester, ingest_dir):
+    path = ingest_dir / "user.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert ingester._load_json(path) is None
+    assert (ingester.invalid_json_dir / "user_record_invalid_json.txt").read_bytes() == b"{not json"
+
+
+def test_load_json_binary_skipped(ingester, ingest_dir):
+    path = ingest_dir / "user.json"
+    path.write_bytes(b"\x00\x05\x16\x07\xff\xfe")
+
+    assert ingester._load_json(path) is None
+    assert not any(ingester.invalid_json_dir.iterdir())
+
+
+def make_record(user_id, email="user@example.com"):
+    return {
+        "user_id": user_id,
+        "name": "Test User",
+        "email": email,
+        "instagram_handle": "@user",
+        "joined_at": "2024-02-01T00:00:00Z",
+        "advocacy_programs": [{
+            "program_id": "p1",
+            "brand": "BrandA",
+            "total_sales_attributed": "12.5",
+            "tasks_completed": [{
+                "task_id": "t1",
+                "platform": "Instagram",
+                "post_url": "https://example.com/post",
+                "likes": "10",
+                "comments": 1,
+                "shares": None,
+                "reach": 100,
+            }],
+        }],
+    }
+
+
+def test_clean_advocate_cleans_nested_programs_and_tasks():
+    cleaned = AdvocateIngester._clean_advocate(make_record("u1", email=" USER@Example.com "))
+
+    assert cleaned["email"] == "user@example.com"
+    assert cleaned["tiktok_handle"] is None
+    program = cleaned["advocacy_programs"][0]
+    assert program["total_sales_attributed"] == 12.5
+    assert program["tasks_completed"][0] == {
+        "task_id": "t1",
+        "platform": "Instagram",
+        "post_url": "https://example.com/post",
+        "likes": 10,
+        "comments": 1,
+        "shares": 0,
+        "reach": 100,
+    }
+
+
+def test_run_dry_run(ingester, ingest_dir):
+    (ingest_dir / "valid.json").write_text(json.dumps([make_record("u1"), make_record("u2")]), encoding="utf-8")
+    # A missing user_id fails validation
+    (ingest_dir / "mixed.json").write_text(json.dumps([make_record("u3"), make_record(None)]), encoding="utf-8")
+    (ingest_dir / "._resource_fork.json").write_bytes(b"\x00\x05\x16\x07")
+
+    stats = ingester.run()
+
+    assert stats.files_seen == 3
+    assert stats.files_parsed == 2
+    assert stats.files_skipped == 1
+    assert stats.records_valid == 3
+    assert stats.records_invalid == 1
+    assert sorted(advocate["user_id"] for advocate in ingester.advocates) == ["u1", "u2", "u3"]
+    failed = json.loads((ingester.failed_validation_dir / "mixed_record_invalid.json").read_text(encoding="utf-8"))
+    assert failed["record"]["user_id"] is None
+    assert failed["record"]["joined_at"] == "2024-02-01T00:00:00+00:00"
+    assert failed["validation_errors"]
+
+
+def test_run_flushes_batches_to_datastore(ingester, ingest_dir, monkeypatch):
+    monkeypatch.setattr(advocate_ingester, "BATCH_SIZE", 2)
+    # Force several small tasks with a short queue
+    monkeypatch.setattr(advocate_ingester, "FILES_PER_TASK", 2)
+    monkeypatch.setattr(advocate_ingester, "MAX_PENDING_TASKS_PER_WORKER", 1)
+    monkeypatch.setattr(advocate_ingester, "MAX_PENDING_FLUSHES", 1)
+    for index in range(5):
+        (ingest_dir / f"user_{index}.json").write_text(json.dumps(make_record(f"u{index}")), encoding="utf-8")
+    ingester.datastore = MagicMock()
+
+    stats = ingester.run()
+
+    assert stats.records_valid == 5
+    assert ingester.advocates == []
+    flushed = [doc["user_id"] for call in ingester.datastore.add_advocates.call_args_list for doc in call.args[0]]
+    assert sorted(flushed) == ["u0", "u1", "u2", "u3", "u4"]
+
+
+def test_run_empty_directory(ingester):
+    stats = ingester.run()
+
+    assert stats.files_seen == 0
+    assert stats.records_valid == 0
+    assert ingester.advocates == []
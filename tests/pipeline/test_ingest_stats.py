@@ -0,0 +1,15 @@
+"""
+ Copyright Duel 2025
+"""
+from src.pipeline.ingest_stats import IngestStats
+
+
+def test_merge_adds_counts():
+    stats = IngestStats(files_seen=2, files_parsed=1)
+    stats.merge(IngestStats(files_parsed=1, files_skipped=1, records_valid=3, records_invalid=2))
+
+    assert stats == IngestStats(files_seen=2, files_parsed=2, files_skipped=1, records_valid=3, records_invalid=2)
+
+
+def test_stats_use_slots():
+    assert not hasattr(IngestStats(), "__dict__")
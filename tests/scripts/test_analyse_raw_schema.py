@@ -0,0 +1,41 @@
+"""
+ Copyright Duel 2025
+"""
+import json
+
+import pytest
+
+from scripts import analyse_raw_schema
+
+
+@pytest.fixture
+def outputs(tmp_path, monkeypatch):
+    """Runs the script from a temporary directory and redirects its output files there."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(analyse_raw_schema, "OUTPUT_SCHEMA", str(tmp_path / "schema_summary.json"))
+    monkeypatch.setattr(analyse_raw_schema, "OUTPUT_EXAMPLES", str(tmp_path / "field_examples.json"))
+    monkeypatch.setattr(analyse_raw_schema, "OUTPUT_CACHE", str(tmp_path / "schema_cache.json"))
+    raw_dir = tmp_path / "data" / "raw"
+    raw_dir.mkdir(parents=True)
+    return tmp_path
+
+
+def test_analyse_raw_json_unnormalised_dir(outputs):
+    (outputs / "data" / "raw" / "x.json").write_text(json.dumps({"user_id": "u1"}), encoding="utf-8")
+
+    analyse_raw_schema.analyse_raw_json("./data/raw")
+
+    assert json.loads((outputs / "schema_summary.json").read_text()) == {"user_id": ["str"]}
+    assert json.loads((outputs / "field_examples.json").read_text()) == {"user_id": "u1"}
+    assert list(json.loads((outputs / "schema_cache.json").read_text())) == ["./data/raw/x.json"]
+
+
+def test_analyse_raw_json_does_not_cache_failures(outputs):
+    raw_dir = outputs / "data" / "raw"
+    (raw_dir / "good.json").write_text(json.dumps({"user_id": "u1"}), encoding="utf-8")
+    (raw_dir / "bad.json").write_text("{not json", encoding="utf-8")
+
+    analyse_raw_schema.analyse_raw_json("data/raw")
+
+    assert list(json.loads((outputs / "schema_cache.json").read_text())) == ["data/raw/good.json"]
+    assert json.loads((outputs / "schema_summary.json").read_text()) == {"user_id": ["str"]}
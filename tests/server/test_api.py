@@ -2,93 +2,119 @@
  Copyright Duel 2025
 """
 import base64
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
+import bcrypt
+import orjson
+import pytest
 from fastapi.testclient import TestClient
 
-from src.server.api import app
+from src.server.api import app, _auth_cache
 
-client = TestClient(app)
 
-
-def make_auth(username="admin", password="advocate-data-analyser"):
+def _basic_auth(username, password):
     token = base64.b64encode(f"{username}:{password}".encode()).decode()
     return {"Authorization": f"Basic {token}"}
 
-@patch("src.server.api.datastore")
-def test_health_ok(mock_datastore):
-    mock_datastore.__bool__.return_value = True
 
-    response = client.get("/health", headers=make_auth())
+def _json(response):
+    """Parses a response body with orjson rather than the stdlib json module."""
+    return orjson.loads(response.content)
 
-    assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
 
+# Built once, rather than re-encoded for every request
+_AUTH_HEADERS = _basic_auth("admin", "advocate-data-analyser")
+_WRONG_PASSWORD_HEADERS = _basic_auth("admin", "wrong")
 
-@patch("src.server.api.datastore")
-def test_health_auth_required(mock_datastore):
-    response = client.get("/health")  # no auth
-    assert response.status_code == 401
 
+@pytest.fixture(scope="session")
+def client():
+    """One client for the whole session, warmed up so request validation is built before the tests run."""
+    with TestClient(app) as test_client:
+        test_client.get("/health", headers=_AUTH_HEADERS)
+        yield test_client
 
-@patch("src.server.api.datastore.get_advocate")
-def test_get_user_success(mock_get_advocate):
-    fake_user = {"user_id": "123", "name": "Alice"}
-    mock_get_advocate.return_value = fake_user
 
-    response = client.get("/users/123", headers=make_auth())
+@pytest.fixture(autouse=True)
+def mock_ds(monkeypatch):
+    """Replaces the API's datastore with a single MagicMock that each test configures."""
+    mock = MagicMock()
+    monkeypatch.setattr("src.server.api.datastore", mock)
+    return mock
 
-    assert response.status_code == 200
-    assert response.json() == fake_user
 
+def test_health_ok(client, mock_ds):
+    mock_ds.__bool__.return_value = True
 
-@patch("src.server.api.datastore.get_advocate")
-def test_get_user_not_found(mock_get_advocate):
-    mock_get_advocate.return_value = None
+    response = client.get("/health", headers=_AUTH_HEADERS)
 
-    response = client.get("/users/unknown", headers=make_auth())
+    assert response.status_code == 200
+    assert _json(response) == {"status": "ok"}
 
-    assert response.status_code == 400
-    assert response.json()["detail"] == "User not found"
+
+def test_health_auth_required(client):
+    response = client.get("/health")  # no auth
+    assert response.status_code == 401
 
 
-@patch("src.server.api.datastore.calculate_top_advocates")
-def test_top_advocates_conversions(mock_calc):
-    mock_calc.return_value = [
-        {"user_id": "1", "total_conversions": 100}
-    ]
+def test_auth_success_is_cached(client, monkeypatch):
+    mock_checkpw = MagicMock(wraps=bcrypt.checkpw)
+    monkeypatch.setattr("src.server.api.bcrypt.checkpw", mock_checkpw)
+    _auth_cache.clear()
 
-    response = client.get("/metrics/top-advocates?metric=conversions", headers=make_auth())
+    assert client.get("/health", headers=_AUTH_HEADERS).status_code == 200
+    assert client.get("/health", headers=_AUTH_HEADERS).status_code == 200
+    assert mock_checkpw.call_count == 1
 
-    assert response.status_code == 200
-    assert response.json()["metric"] == "conversions"
-    assert len(response.json()["results"]) == 1
+    # A wrong password for a cached user still goes through bcrypt and is rejected
+    assert client.get("/health", headers=_WRONG_PASSWORD_HEADERS).status_code == 401
+    assert mock_checkpw.call_count == 2
 
 
-@patch("src.server.api.datastore.calculate_top_advocates")
-def test_top_advocates_engagement(mock_calc):
-    mock_calc.return_value = [
-        {"user_id": "1", "total_engagement": 500}
-    ]
+def test_get_user_success(client, mock_ds):
+    fake_user = {"user_id": "123", "name": "Alice"}
+    mock_ds.get_advocate.return_value = fake_user
 
-    response = client.get("/metrics/top-advocates?metric=engagement", headers=make_auth())
+    response = client.get("/users/123", headers=_AUTH_HEADERS)
 
     assert response.status_code == 200
-    assert response.json()["metric"] == "engagement"
+    assert _json(response) == fake_user
+
+
+def test_get_user_not_found(client, mock_ds):
+    mock_ds.get_advocate.return_value = None
 
+    response = client.get("/users/unknown", headers=_AUTH_HEADERS)
 
-def test_top_advocates_invalid_metric():
-    response = client.get("/metrics/top-advocates?metric=unknown", headers=make_auth())
     assert response.status_code == 400
-    assert response.json()["detail"] == "Invalid metric"
+    assert _json(response)["detail"] == "User not found"
 
 
-def test_swagger_requires_auth():
+@pytest.mark.parametrize("metric, results, status", [
+    ("conversions", [{"user_id": "1", "total_conversions": 100}], 200),
+    ("engagement", [{"user_id": "1", "total_engagement": 500}], 200),
+    ("unknown", None, 400),
+])
+def test_top_advocates(client, mock_ds, metric, results, status):
+    mock_ds.calculate_top_advocates.return_value = results
+
+    response = client.get(f"/metrics/top-advocates?metric={metric}", headers=_AUTH_HEADERS)
+
+    assert response.status_code == status
+    if status == 200:
+        assert _json(response) == {"metric": metric, "results": results}
+    else:
+        assert _json(response)["detail"] == "Invalid metric"
+        mock_ds.calculate_top_advocates.assert_not_called()
+
+
+def test_swagger_requires_auth(client):
     response = client.get("/swagger")
     assert response.status_code == 401
 
 
-def test_swagger_success():
-    response = client.get("/swagger", headers=make_auth())
-    assert response.status_code == 200
-    assert "text/html" in response.headers["content-type"]
+def test_swagger_success(client):
+    # Only the headers are checked, so the HTML body is never read
+    with client.stream("GET", "/swagger", headers=_AUTH_HEADERS) as response:
+        assert response.status_code == 200
+        assert "text/html" in response.headers["content-type"]
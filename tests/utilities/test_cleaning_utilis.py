@@ -3,71 +3,68 @@
 """
 import datetime
 
+import pytest
+
 from src.utilities.cleaning_utils import CleaningUtils
 
 
 class TestCleaningUtils:
 
-    def test_clean_email_valid(self):
-        assert CleaningUtils.clean_email("  USER@Test.COM ") == "user@test.com"
-
-    def test_clean_email_invalid_format(self):
-        assert CleaningUtils.clean_email("not-an-email") is None
-
-    def test_clean_email_missing(self):
-        assert CleaningUtils.clean_email(None) is None
-
-    def test_clean_handle_valid(self):
-        assert CleaningUtils.clean_handle("@User123") == "@user123"
-
-    def test_clean_handle_missing(self):
-        assert CleaningUtils.clean_handle("") is None
-
-    def test_clean_handle_adds_at_symbol(self):
-        assert CleaningUtils.clean_handle("user") == "@user"
-
-    def test_clean_handle_strips_invalid_chars(self):
-        assert CleaningUtils.clean_handle("#£$User!") == "@user"
+    @pytest.mark.parametrize("value, expected", [
+        ("  USER@Test.COM ", "user@test.com"),
+        ("not-an-email", None),
+        (None, None),
+    ])
+    def test_clean_email(self, value, expected):
+        assert CleaningUtils.clean_email(value) == expected
+
+    @pytest.mark.parametrize("value, expected", [
+        ("@User123", "@user123"),
+        ("", None),
+        ("user", "@user"),
+        ("#£$User!", "@user"),
+    ])
+    def test_clean_handle(self, value, expected):
+        assert CleaningUtils.clean_handle(value) == expected
 
     def test_clean_date_valid_iso(self):
         res = CleaningUtils.clean_date("2024-05-17T10:30:00Z")
         assert isinstance(res, datetime.datetime)
         assert res.year == 2024
-
-    def test_clean_date_invalid(self):
-        assert CleaningUtils.clean_date("not-a-date") is None
-
-    def test_clean_date_none(self):
-        assert CleaningUtils.clean_date(None) is None
-
-    def test_clean_int_valid(self):
-        assert CleaningUtils.clean_int("42") == 42
-        assert CleaningUtils.clean_int(99) == 99
-
-    def test_clean_int_invalid(self):
-        assert CleaningUtils.clean_int("NaN") == 0
-
-    def test_clean_int_missing(self):
-        assert CleaningUtils.clean_int(None) == 0
-
-    def test_clean_float_valid(self):
-        assert CleaningUtils.clean_float("10.5") == 10.5
-        assert CleaningUtils.clean_float(2.71) == 2.71
-
-    def test_clean_float_invalid(self):
-        assert CleaningUtils.clean_float("not-a-number") == 0.0
-
-    def test_clean_float_missing(self):
-        assert CleaningUtils.clean_float(None) == 0.0
-
-    def test_clean_url_valid(self):
-        assert CleaningUtils.clean_url("https://example.com") == "https://example.com"
-
-    def test_clean_url_invalid(self):
-        assert CleaningUtils.clean_url("broken_link") is None
-
-    def test_clean_url_missing(self):
-        assert CleaningUtils.clean_url(None) is None
+        assert res.utcoffset() == datetime.timedelta(0)
+
+    def test_clean_date_date_only_with_z(self):
+        assert CleaningUtils.clean_date("2024-01-01Z").date() == datetime.date(2024, 1, 1)
+
+    @pytest.mark.parametrize("value", ["not-a-date", None, 20240101])
+    def test_clean_date_invalid(self, value):
+        assert CleaningUtils.clean_date(value) is None
+
+    @pytest.mark.parametrize("value, expected", [
+        ("42", 42),
+        (99, 99),
+        ("NaN", 0),
+        (None, 0),
+    ])
+    def test_clean_int(self, value, expected):
+        assert CleaningUtils.clean_int(value) == expected
+
+    @pytest.mark.parametrize("value, expected", [
+        ("10.5", 10.5),
+        (2.71, 2.71),
+        ("not-a-number", 0.0),
+        (None, 0.0),
+    ])
+    def test_clean_float(self, value, expected):
+        assert CleaningUtils.clean_float(value) == expected
+
+    @pytest.mark.parametrize("value, expected", [
+        ("https://example.com", "https://example.com"),
+        ("broken_link", None),
+        (None, None),
+    ])
+    def test_clean_url(self, value, expected):
+        assert CleaningUtils.clean_url(value) == expected
 
     def test_serialise_dates_datetime(self):
         dt = datetime.datetime(2024, 5, 17, 12, 0)